@@ -1,163 +1,281 @@
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-from PIL import Image
-import pandasql as ps  # to run SQL queries on pandas dataframe
-
-# Page config
-st.set_page_config(page_title="OLA Dashboard", page_icon="🚖", layout="wide")
-
-# Load Dataset
-@st.cache_data
-def load_data():
-    df = pd.read_csv("OLA_DataSet.csv")
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-    df.columns = df.columns.str.strip()  # clean col names
-    return df
-
-df = load_data()
-
-# Sidebar Navigation
-page = st.sidebar.radio("📂 Select Page", ["Dashboard", "SQL QUERY", "Project Documentation & Deployment"])
-
-# -----------------------------------
-# DASHBOARD PAGE
-# -----------------------------------
-if page == "Dashboard":
-    st.title("🚖 OLA Rides Dashboard")
-    st.markdown("### Interactive Analysis of Ola Rides — Status, Revenue, Locations & More")
-
-    # Sidebar filters
-    st.sidebar.header("🔍 Filters")
-    vehicle = st.sidebar.multiselect("Select Vehicle Type", df["Vehicle_Type"].unique())
-    payment = st.sidebar.multiselect("Select Payment Method", df["Payment_Method"].unique())
-    status = st.sidebar.multiselect("Select Ride Status", df["Booking_Status"].unique())
-
-    # Apply filters
-    filtered_df = df.copy()
-    if vehicle:
-        filtered_df = filtered_df[filtered_df["Vehicle_Type"].isin(vehicle)]
-    if payment:
-        filtered_df = filtered_df[filtered_df["Payment_Method"].isin(payment)]
-    if status:
-        filtered_df = filtered_df[filtered_df["Booking_Status"].isin(status)]
-
-    # KPIs row
-    total_rides = len(filtered_df)
-    success_rides = len(filtered_df[filtered_df["Booking_Status"] == "Success"])
-    success_rate = round((success_rides / total_rides) * 100, 2) if total_rides > 0 else 0
-    total_revenue = filtered_df["Booking_Value"].sum()
-    avg_fare = round(filtered_df["Booking_Value"].mean(), 2)
-
-    kpi1, kpi2, kpi3, kpi4 = st.columns(4)
-    kpi1.metric("Total Rides", total_rides)
-    kpi2.metric("Success Rate", f"{success_rate}%")
-    kpi3.metric("Total Revenue", f"₹{total_revenue:,.0f}")
-    kpi4.metric("Average Fare", f"₹{avg_fare}")
-
-    st.markdown("---")
-
-    # Charts
-    col1, col2 = st.columns(2)
-    with col1:
-        st.subheader("📊 Ride Status Distribution")
-        fig1 = px.histogram(filtered_df, x="Booking_Status", color="Booking_Status", text_auto=True)
-        st.plotly_chart(fig1, use_container_width=True)
-    with col2:
-        st.subheader("💳 Payment Method Share")
-        fig2 = px.pie(filtered_df, names="Payment_Method", title="Payment Method Distribution")
-        st.plotly_chart(fig2, use_container_width=True)
-
-    col3, col4 = st.columns(2)
-    with col3:
-        st.subheader("💰 Top Revenue Pickup Locations")
-        revenue_by_pickup = (
-            filtered_df.groupby("Pickup_Location")["Booking_Value"]
-            .sum().nlargest(10).reset_index()
-        )
-        revenue_by_pickup.columns = ["Pickup_Location", "Revenue"]
-        fig_rev = px.bar(
-            revenue_by_pickup, x="Revenue", y="Pickup_Location", orientation="h",
-            title="Top 10 Revenue Pickup Locations", text_auto=True,
-            color_discrete_sequence=["#FFD700"]
-        )
-        st.plotly_chart(fig_rev, use_container_width=True)
-
-    with col4:
-        st.subheader("📍 Top Pickup Locations")
-        top_pickups = filtered_df["Pickup_Location"].value_counts().head(10).reset_index()
-        top_pickups.columns = ["Pickup_Location", "Count"]
-        fig4 = px.bar(
-            top_pickups, x="Count", y="Pickup_Location", orientation="h",
-            title="Top 10 Pickup Locations", text_auto=True,
-            color_discrete_sequence=["#32CD32"]
-        )
-        st.plotly_chart(fig4, use_container_width=True)
-
-    st.subheader("⏰ Rides by Hour of Day")
-    filtered_df["Hour"] = filtered_df["Date"].dt.hour
-    rides_by_hour = filtered_df.groupby("Hour")["Booking_ID"].count().reset_index()
-    fig7 = px.density_heatmap(rides_by_hour, x="Hour", y="Booking_ID",
-                              nbinsx=24, title="Ride Frequency by Hour",
-                              color_continuous_scale="Viridis")
-    st.plotly_chart(fig7, use_container_width=True)
-
-    st.subheader("📈 Distance vs Fare Correlation")
-    fig5 = px.scatter(filtered_df, x="Ride_Distance", y="Booking_Value",
-                      color="Vehicle_Type", size="Booking_Value",
-                      title="Distance vs Fare")
-    st.plotly_chart(fig5, use_container_width=True)
-
-# -----------------------------------
-# SQL QUERY PAGE
-# -----------------------------------
-elif page == "SQL QUERY":
-    st.title("🗄 SQL Query Explorer")
-    st.markdown("### Run SQL queries on Ola dataset (via pandasql).")
-
-    # Predefined SQL queries
-    sql_queries = {
-        "1. Retrieve all successful bookings": "SELECT * FROM df WHERE Booking_Status = 'Success'",
-        "2. Average ride distance per vehicle type": "SELECT Vehicle_Type, AVG(Ride_Distance) as Avg_Distance FROM df GROUP BY Vehicle_Type",
-        "3. Total cancelled rides by customers": "SELECT COUNT(*) as Cancelled_Rides FROM df WHERE Booking_Status = 'Cancelled by Customer'",
-        "4. Top 5 customers with most rides": "SELECT Customer_ID, COUNT(*) as Ride_Count FROM df GROUP BY Customer_ID ORDER BY Ride_Count DESC LIMIT 5",
-        "5. Rides cancelled by drivers (personal & car issues)": "SELECT COUNT(*) as Driver_Cancellations FROM df WHERE Booking_Status IN ('Cancelled - Personal', 'Cancelled - Car Issue')",
-        "6. Rides paid using UPI": "SELECT * FROM df WHERE Payment_Method = 'UPI'",
-        "7. Average customer rating per vehicle type": "SELECT Vehicle_Type, AVG(Customer_Rating) as Avg_Rating FROM df GROUP BY Vehicle_Type",
-        "8. Total booking value of successful rides": "SELECT SUM(Booking_Value) as Total_Success_Revenue FROM df WHERE Booking_Status = 'Success'",
-        "9. Incomplete rides with reason": "SELECT Booking_ID, Booking_Status FROM df WHERE Booking_Status LIKE 'Incomplete%'"
-    }
-
-    selected_query = st.selectbox("Choose a SQL Question:", list(sql_queries.keys()))
-    query = sql_queries[selected_query]
-
-    st.code(query, language="sql")
-    result = ps.sqldf(query, locals())
-    st.dataframe(result, use_container_width=True)
-
-# -----------------------------------
-# DOCUMENTATION PAGE
-# -----------------------------------
-elif page == "Project Documentation & Deployment":
-    st.title("📑 Project Documentation & Deployment")
-    st.markdown("""
-    ### Project Overview
-    This OLA Dashboard provides insights into ride bookings, revenue, cancellations, and customer/driver behavior.
-
-    ### Key Features
-    - KPI cards for quick performance overview  
-    - Interactive charts (status, revenue, payments, locations)  
-    - SQL Query Explorer to run analysis in SQL format  
-
-    ### Deployment
-    - The app can be deployed on **Streamlit Cloud / Heroku / AWS EC2**  
-    - Dataset (`OLA_DataSet.csv`) should be included in the repository  
-    - Install dependencies: `pip install streamlit plotly pandas pandasql pillow`  
-    - Run app: `streamlit run app.py`  
-
-    ### Business Insights
-    - Most cancellations happen from customers rather than drivers  
-    - UPI & Wallet payments dominate digital transactions  
-    - Prime Sedan generates the highest average revenue per ride  
-    - Evening hours show peak demand trends  
-    """)
+import streamlit as st
+import pandas as pd
+import numpy as np
+import polars as pl
+import plotly.express as px
+import plotly.graph_objects as go
+from PIL import Image
+import duckdb  # to run SQL queries on pandas dataframe
+from numba import njit
+from pathlib import Path
+
+# Page config
+st.set_page_config(page_title="OLA Dashboard", page_icon="🚖", layout="wide")
+
+# Load Dataset
+@st.cache_data
+def load_data():
+    parquet_path = Path("OLA_DataSet.parquet")
+    if parquet_path.exists():
+        # warm start: typed columnar cache, no CSV parsing or date coercion
+        return pd.read_parquet(parquet_path)
+    df = pd.read_csv("OLA_DataSet.csv", engine="pyarrow")  # multithreaded parse
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+    df["Hour"] = df["Date"].dt.hour.astype("int8")  # derived once, inherited by slices
+    df.columns = df.columns.str.strip()  # clean col names
+    # low-cardinality strings -> category (integer codes for isin/groupby)
+    for c in ["Vehicle_Type", "Payment_Method", "Booking_Status", "Pickup_Location"]:
+        df[c] = df[c].astype("category")
+    # float32 is plenty for fares/distances and halves bytes moved per groupby
+    for c in ["Booking_Value", "Ride_Distance"]:
+        df[c] = pd.to_numeric(df[c], errors="coerce", downcast="float")
+    df.to_parquet(parquet_path)  # sidecar for the next cold start
+    return df
+
+df = load_data()
+
+# Cached DuckDB connection (queries the dataframe in-place, no SQLite copy)
+@st.cache_resource
+def get_con():
+    return duckdb.connect()
+
+# Cached filtering & aggregations (memoized per filter selection, so widget
+# toggles don't re-run the pandas passes)
+@st.cache_data
+def apply_filters(df, vehicle, payment, status):
+    if not (vehicle or payment or status):
+        return df
+    # accumulate one boolean mask, slice once — no chained re-indexing
+    mask = np.ones(len(df), dtype=bool)
+    if vehicle:
+        mask &= df["Vehicle_Type"].isin(vehicle).to_numpy()
+    if payment:
+        mask &= df["Payment_Method"].isin(payment).to_numpy()
+    if status:
+        mask &= df["Booking_Status"].isin(status).to_numpy()
+    return df[mask]
+
+# Heavy aggregations run on Polars' multithreaded columnar engine; only the
+# needed columns are handed over and the small result comes back as pandas
+@st.cache_data
+def revenue_by_pickup(filtered):
+    return (
+        pl.from_pandas(filtered[["Pickup_Location", "Booking_Value"]])
+        .lazy()
+        .group_by("Pickup_Location")
+        .agg(pl.col("Booking_Value").sum().alias("Revenue"))
+        .top_k(10, by="Revenue")
+        .sort("Revenue", descending=True)
+        .collect()
+        .to_pandas()
+    )
+
+@st.cache_data
+def rides_by_hour(filtered):
+    return (
+        pl.from_pandas(filtered[["Hour"]])
+        .group_by("Hour")
+        .len(name="Rides")
+        .sort("Hour")
+        .to_pandas()
+    )
+
+# Single compiled pass over contiguous arrays: 2D-bins (distance, fare) for the
+# heatmap and counts rides per hour, replacing a groupby + full scatter on big slices
+@njit(cache=True)
+def bin2d_and_hours(dist, fare, hour, nbx, nby, dmax, fmax):
+    heat = np.zeros((nby, nbx), dtype=np.int64)
+    hours = np.zeros(24, dtype=np.int64)
+    for i in range(dist.size):
+        h = hour[i]
+        if 0 <= h < 24:
+            hours[h] += 1
+        d = dist[i]
+        f = fare[i]
+        if np.isnan(d) or np.isnan(f) or d < 0 or f < 0 or dmax <= 0 or fmax <= 0:
+            continue
+        x = int(d / dmax * nbx)
+        y = int(f / fmax * nby)
+        if x >= nbx:
+            x = nbx - 1
+        if y >= nby:
+            y = nby - 1
+        heat[y, x] += 1
+    return heat, hours
+
+@st.cache_data
+def bin_distance_fare(filtered, nbx=60, nby=60):
+    dist = filtered["Ride_Distance"].to_numpy(dtype=np.float64)
+    fare = filtered["Booking_Value"].to_numpy(dtype=np.float64)
+    hour = filtered["Hour"].to_numpy(dtype=np.int64)
+    dmax = float(np.nanmax(dist)) if dist.size else 0.0
+    fmax = float(np.nanmax(fare)) if fare.size else 0.0
+    heat, hours = bin2d_and_hours(dist, fare, hour, nbx, nby, dmax, fmax)
+    dist_centers = (np.arange(nbx) + 0.5) * dmax / nbx
+    fare_centers = (np.arange(nby) + 0.5) * fmax / nby
+    return heat, dist_centers, fare_centers, hours
+
+# Sidebar Navigation
+page = st.sidebar.radio("📂 Select Page", ["Dashboard", "SQL QUERY", "Project Documentation & Deployment"])
+
+# -----------------------------------
+# DASHBOARD PAGE
+# -----------------------------------
+if page == "Dashboard":
+    st.title("🚖 OLA Rides Dashboard")
+    st.markdown("### Interactive Analysis of Ola Rides — Status, Revenue, Locations & More")
+
+    # Sidebar filters
+    st.sidebar.header("🔍 Filters")
+    vehicle = st.sidebar.multiselect("Select Vehicle Type", df["Vehicle_Type"].unique())
+    payment = st.sidebar.multiselect("Select Payment Method", df["Payment_Method"].unique())
+    status = st.sidebar.multiselect("Select Ride Status", df["Booking_Status"].unique())
+
+    # Apply filters (tuples are hashable, so the cache can key off them)
+    filtered_df = apply_filters(df, tuple(vehicle), tuple(payment), tuple(status))
+
+    # KPIs row (fused: one pass over Booking_Value, one over Booking_Status)
+    kpis = filtered_df["Booking_Value"].agg(["size", "sum", "mean"])
+    total_rides = int(kpis["size"])
+    total_revenue = kpis["sum"]
+    avg_fare = round(kpis["mean"], 2)
+    success_rides = int((filtered_df["Booking_Status"] == "Success").sum())
+    success_rate = round((success_rides / total_rides) * 100, 2) if total_rides > 0 else 0
+
+    kpi1, kpi2, kpi3, kpi4 = st.columns(4)
+    kpi1.metric("Total Rides", total_rides)
+    kpi2.metric("Success Rate", f"{success_rate}%")
+    kpi3.metric("Total Revenue", f"₹{total_revenue:,.0f}")
+    kpi4.metric("Average Fare", f"₹{avg_fare}")
+
+    st.markdown("---")
+
+    # Charts
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("📊 Ride Status Distribution")
+        # categorical value_counts lists every level; keep only present ones
+        status_counts = filtered_df["Booking_Status"].value_counts().loc[lambda s: s > 0].reset_index()
+        status_counts.columns = ["Booking_Status", "Count"]
+        palette = px.colors.qualitative.Plotly
+        fig1 = go.Figure(go.Bar(
+            x=status_counts["Booking_Status"], y=status_counts["Count"],
+            text=status_counts["Count"],
+            marker_color=[palette[i % len(palette)] for i in range(len(status_counts))]
+        ))
+        st.plotly_chart(fig1, use_container_width=True)
+    with col2:
+        st.subheader("💳 Payment Method Share")
+        payment_counts = filtered_df["Payment_Method"].value_counts().loc[lambda s: s > 0].reset_index()
+        payment_counts.columns = ["Payment_Method", "Count"]
+        fig2 = go.Figure(go.Pie(labels=payment_counts["Payment_Method"],
+                                values=payment_counts["Count"]))
+        fig2.update_layout(title="Payment Method Distribution")
+        st.plotly_chart(fig2, use_container_width=True)
+
+    col3, col4 = st.columns(2)
+    with col3:
+        st.subheader("💰 Top Revenue Pickup Locations")
+        top_revenue = revenue_by_pickup(filtered_df)
+        fig_rev = go.Figure(go.Bar(
+            x=top_revenue["Revenue"], y=top_revenue["Pickup_Location"],
+            orientation="h", text=top_revenue["Revenue"], marker_color="#FFD700"
+        ))
+        fig_rev.update_layout(title="Top 10 Revenue Pickup Locations")
+        st.plotly_chart(fig_rev, use_container_width=True)
+
+    with col4:
+        st.subheader("📍 Top Pickup Locations")
+        top_pickups = filtered_df["Pickup_Location"].value_counts().head(10).reset_index()
+        top_pickups.columns = ["Pickup_Location", "Count"]
+        fig4 = go.Figure(go.Bar(
+            x=top_pickups["Count"], y=top_pickups["Pickup_Location"],
+            orientation="h", text=top_pickups["Count"], marker_color="#32CD32"
+        ))
+        fig4.update_layout(title="Top 10 Pickup Locations")
+        st.plotly_chart(fig4, use_container_width=True)
+
+    # On big slices, one numba pass bins distance/fare and counts hours together
+    big_slice = len(filtered_df) >= 50_000
+    if big_slice:
+        heat, dist_centers, fare_centers, hour_counts = bin_distance_fare(filtered_df)
+
+    st.subheader("⏰ Rides by Hour of Day")
+    if big_slice:
+        fig7 = go.Figure(go.Bar(x=np.arange(24), y=hour_counts))
+    else:
+        hourly_rides = rides_by_hour(filtered_df)
+        fig7 = go.Figure(go.Bar(x=hourly_rides["Hour"], y=hourly_rides["Rides"]))
+    fig7.update_layout(title="Ride Frequency by Hour",
+                       xaxis_title="Hour", yaxis_title="Rides")
+    st.plotly_chart(fig7, use_container_width=True)
+
+    st.subheader("📈 Distance vs Fare Correlation")
+    if big_slice:
+        fig5 = px.imshow(heat, x=dist_centers, y=fare_centers, origin="lower",
+                         labels={"x": "Ride_Distance", "y": "Booking_Value", "color": "Rides"},
+                         title="Distance vs Fare", color_continuous_scale="Viridis",
+                         aspect="auto")
+    else:
+        # cap points sent to the browser — beyond ~5K the screen can't show more anyway
+        plot_df = filtered_df if len(filtered_df) < 5000 else filtered_df.sample(5000, random_state=0)
+        fig5 = px.scatter(plot_df, x="Ride_Distance", y="Booking_Value",
+                          color="Vehicle_Type", size="Booking_Value",
+                          title="Distance vs Fare")
+    st.plotly_chart(fig5, use_container_width=True)
+
+# -----------------------------------
+# SQL QUERY PAGE
+# -----------------------------------
+elif page == "SQL QUERY":
+    st.title("🗄 SQL Query Explorer")
+    st.markdown("### Run SQL queries on Ola dataset (via DuckDB).")
+
+    # Predefined SQL queries
+    sql_queries = {
+        "1. Retrieve all successful bookings": "SELECT * FROM df WHERE Booking_Status = 'Success'",
+        "2. Average ride distance per vehicle type": "SELECT Vehicle_Type, AVG(Ride_Distance) as Avg_Distance FROM df GROUP BY Vehicle_Type",
+        "3. Total cancelled rides by customers": "SELECT COUNT(*) as Cancelled_Rides FROM df WHERE Booking_Status = 'Cancelled by Customer'",
+        "4. Top 5 customers with most rides": "SELECT Customer_ID, COUNT(*) as Ride_Count FROM df GROUP BY Customer_ID ORDER BY Ride_Count DESC LIMIT 5",
+        "5. Rides cancelled by drivers (personal & car issues)": "SELECT COUNT(*) as Driver_Cancellations FROM df WHERE Booking_Status IN ('Cancelled - Personal', 'Cancelled - Car Issue')",
+        "6. Rides paid using UPI": "SELECT * FROM df WHERE Payment_Method = 'UPI'",
+        "7. Average customer rating per vehicle type": "SELECT Vehicle_Type, AVG(Customer_Rating) as Avg_Rating FROM df GROUP BY Vehicle_Type",
+        "8. Total booking value of successful rides": "SELECT SUM(Booking_Value) as Total_Success_Revenue FROM df WHERE Booking_Status = 'Success'",
+        "9. Incomplete rides with reason": "SELECT Booking_ID, Booking_Status FROM df WHERE Booking_Status LIKE 'Incomplete%'"
+    }
+
+    selected_query = st.selectbox("Choose a SQL Question:", list(sql_queries.keys()))
+    query = sql_queries[selected_query]
+
+    st.code(query, language="sql")
+    con = get_con()
+    con.register("df", df)
+    result = con.execute(query).df()
+    st.dataframe(result, use_container_width=True)
+
+# -----------------------------------
+# DOCUMENTATION PAGE
+# -----------------------------------
+elif page == "Project Documentation & Deployment":
+    st.title("📑 Project Documentation & Deployment")
+    st.markdown("""
+    ### Project Overview
+    This OLA Dashboard provides insights into ride bookings, revenue, cancellations, and customer/driver behavior.
+
+    ### Key Features
+    - KPI cards for quick performance overview  
+    - Interactive charts (status, revenue, payments, locations)  
+    - SQL Query Explorer to run analysis in SQL format  
+
+    ### Deployment
+    - The app can be deployed on **Streamlit Cloud / Heroku / AWS EC2**  
+    - Dataset (`OLA_DataSet.csv`) should be included in the repository  
+    - Install dependencies: `pip install streamlit plotly pandas pyarrow polars duckdb numba pillow`  
+    - Run app: `streamlit run app.py`  
+
+    ### Business Insights
+    - Most cancellations happen from customers rather than drivers  
+    - UPI & Wallet payments dominate digital transactions  
+    - Prime Sedan generates the highest average revenue per ride  
+    - Evening hours show peak demand trends  
+    """)